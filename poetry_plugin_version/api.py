@@ -1,20 +1,68 @@
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
+from poetry.core.masonry import api as core_api
 from poetry.core.masonry.api import (
-    build_editable,
     build_sdist,
-    build_wheel,
     get_requires_for_build_editable,
     get_requires_for_build_sdist,
     get_requires_for_build_wheel,
-    prepare_metadata_for_build_editable,
-    prepare_metadata_for_build_wheel,
 )
 
 from . import patch
+from .states import (
+    _get_and_apply_version,
+    _get_metadata_version,
+    _get_pyproject_path,
+)
 
 patch.activate()
 
+
+def _reuse_metadata_version(metadata_directory: str | None) -> None:
+    # Seed the resolved version from metadata prepared by an earlier hook call,
+    # so that building the wheel does not resolve it again.
+    if metadata_directory is None:
+        return
+    if (version := _get_metadata_version(Path(metadata_directory))) is None:
+        return
+    if (pyproject_path := _get_pyproject_path()) is not None:
+        _get_and_apply_version(pyproject_path=pyproject_path, known_version=version)
+
+
+def prepare_metadata_for_build_wheel(
+    metadata_directory: str, config_settings: dict[str, Any] | None = None
+) -> str:
+    from poetry.core.masonry.builders.wheel import WheelBuilder
+
+    poetry = patch._create_poetry_for_metadata(Path.cwd())
+    builder = WheelBuilder(poetry, config_settings=config_settings)
+    dist_info = builder.prepare_metadata(Path(metadata_directory))
+    return dist_info.name
+
+
+def build_wheel(
+    wheel_directory: str,
+    config_settings: dict[str, Any] | None = None,
+    metadata_directory: str | None = None,
+) -> str:
+    _reuse_metadata_version(metadata_directory)
+    return core_api.build_wheel(wheel_directory, config_settings, metadata_directory)
+
+
+def build_editable(
+    wheel_directory: str,
+    config_settings: dict[str, Any] | None = None,
+    metadata_directory: str | None = None,
+) -> str:
+    _reuse_metadata_version(metadata_directory)
+    return core_api.build_editable(wheel_directory, config_settings, metadata_directory)
+
+
+prepare_metadata_for_build_editable = prepare_metadata_for_build_wheel
+
 __all__ = (
     "build_sdist",
     "build_wheel",
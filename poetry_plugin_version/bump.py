@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+from poetry.console.commands.version import VersionCommand
+from poetry.core.pyproject.toml import PyProjectTOML
+
+from .utils import (
+    get_version_filename,
+    get_version_from_file,
+    is_dynamic_version,
+    locate_version_file,
+    replace_version_in_file,
+)
+
+NAME = "poetry-plugin-version"
+
+
+def get_version_file(pyproject_path: Path) -> Path:
+    pyproject = PyProjectTOML(pyproject_path).data
+    tool_item = pyproject.get("tool", {})
+    poetry_config = cast(dict[str, Any], tool_item.get("poetry", {}))
+    if not is_dynamic_version(tool_item.get(NAME), poetry_config):
+        raise ValueError(
+            f'Version is not dynamic, set [tool.{NAME}] or version = "0" '
+            "in pyproject.toml to use it"
+        )
+    if (filename := get_version_filename(tool_item.get(NAME))) is None:
+        raise ValueError("Version comes from Git tag, there is no file to update")
+    name = poetry_config.get("name") or pyproject.get("project", {}).get("name", "")
+    return locate_version_file(filename, name, poetry_config, pyproject, pyproject_path)
+
+
+def bump_version(
+    project: Path, rule: str, next_phase: bool = False, dry_run: bool = False
+) -> tuple[str, str, Path]:
+    """Bump the ``__version__`` of the project at ``project`` by ``rule``.
+
+    ``rule`` is either a version number or one of the `poetry version` rules.
+    Returns the old version, the new version and the file that holds them.
+    """
+    pyproject_path = project if project.is_file() else project / "pyproject.toml"
+    if not pyproject_path.is_file():
+        raise FileNotFoundError(f"pyproject.toml file not found at {pyproject_path}")
+    version_path = get_version_file(pyproject_path.resolve())
+
+    def increment(version: str) -> str:
+        return VersionCommand().increment_version(version, rule, next_phase).text
+
+    if not dry_run:
+        old, new = replace_version_in_file(version_path, increment)
+        return old, new, version_path
+    if not (version := get_version_from_file(version_path)):
+        raise ValueError(
+            f"No valid __version__ variable found in {version_path.name}, "
+            "cannot update dynamic version"
+        )
+    return version, increment(version), version_path
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+from cleo.formatters.formatter import Formatter
+from cleo.helpers import argument, option
+from poetry.console.commands.command import Command
+
+from .bump import bump_version
+from .git import iter_version_history
+
+if TYPE_CHECKING:  # pragma: no cover
+    from cleo.io.inputs.argument import Argument
+    from cleo.io.inputs.option import Option
+
+
+class BumpVersionCommand(Command):
+    name = "bump-version"
+    description = "Bumps the __version__ variable used as dynamic version."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument("version", "The version number or the rule to update the version."),
+        argument(
+            "projects",
+            "Directories of the projects to update (default: current project).",
+            optional=True,
+            multiple=True,
+        ),
+    ]
+    options: ClassVar[list[Option]] = [
+        option("short", "s", "Output the version number only"),
+        option("dry-run", None, "Do not update the version file"),
+        option("next-phase", None, "Increment the phase of the current version"),
+    ]
+
+    help = """\
+The bump-version command rewrites the <comment>__version__</> string literal that
+poetry-plugin-version reads the dynamic version from. Only the literal is replaced,
+its quoting and the rest of the file are kept as they are.
+
+The new version should ideally be a valid semver string or a valid bump rule:
+patch, minor, major, prepatch, preminor, premajor, prerelease.
+"""
+
+    def handle(self) -> int:
+        rule = self.argument("version")
+        projects = [Path(p) for p in self.argument("projects")] or [
+            self.get_application().project_directory
+        ]
+        status = 0
+        for project in projects:
+            try:
+                old, new, version_path = bump_version(
+                    project,
+                    rule,
+                    next_phase=self.option("next-phase"),
+                    dry_run=self.option("dry-run"),
+                )
+            except (ValueError, FileNotFoundError) as e:
+                # Keep going, the other projects of a batch are independent
+                self.line_error(f"<error>{project}: {e}</>")
+                status = 1
+                continue
+            if self.option("short"):
+                self.line(new)
+            else:
+                self.line(
+                    f"Bumping version from <b>{old}</> to <fg=green>{new}</>"
+                    f" in {version_path}"
+                )
+        return status
+
+
+class VersionHistoryCommand(Command):
+    name = "version-history"
+    description = "Shows the Git tag version of every commit as JSON lines."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument(
+            "range",
+            "The revision range to list, as accepted by git rev-list.",
+            optional=True,
+            default="HEAD",
+        ),
+    ]
+
+    help = """\
+The version-history command prints one JSON object per commit of the range, parents
+first, with the nearest tag and the distance to it. <comment>version</> is the tag for
+commits that are exactly on it, which is what a build with
+<comment>source = "git-tag"</> would use, and null otherwise.
+"""
+
+    def handle(self) -> int:
+        try:
+            for entry in iter_version_history(
+                self.get_application().project_directory, self.argument("range")
+            ):
+                record = json.dumps(
+                    {
+                        "commit": entry.commit,
+                        "version": entry.version,
+                        "tag": entry.tag,
+                        "distance": entry.distance,
+                    }
+                )
+                self.line(Formatter.escape(record))
+        except (ValueError, FileNotFoundError) as e:
+            self.line_error(f"<error>{e}</>")
+            return 1
+        return 0
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import re
+import subprocess
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import NamedTuple
+
+ARCHIVAL_FILE = ".git_archival.txt"
+# `git describe` output for a commit that is not exactly on a tag
+_DESCRIBE_DISTANCE = re.compile(r"-\d+-g[0-9a-f]+$")
+
+
+class VersionHistoryEntry(NamedTuple):
+    commit: str
+    tag: str | None
+    distance: int | None
+
+    @property
+    def version(self) -> str | None:
+        # Git tag mode only builds commits that are exactly on a tag
+        return self.tag if self.distance == 0 else None
+
+
+def find_git_dir(start: Path) -> tuple[Path, Path] | None:
+    """Return ``(worktree, git_dir)`` of the repository containing ``start``."""
+    for level in [start, *start.parents]:
+        dot_git = level / ".git"
+        if dot_git.is_dir():
+            return level, dot_git
+        if dot_git.is_file():
+            # Linked worktrees and submodules use a `gitdir: <path>` file
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                return level, (level / content[len("gitdir:") :].strip()).resolve()
+    return None
+
+
+def read_archival_file(start: Path) -> dict[str, str] | None:
+    """Read the export-subst fields of the nearest ``.git_archival.txt``.
+
+    Returns ``None`` when there is no such file or it was not expanded by
+    ``git archive``, which is the case in a regular checkout. The search stops
+    at the root of a Git repository, files further up belong to other projects.
+    """
+    for level in [start, *start.parents]:
+        if (path := level / ARCHIVAL_FILE).is_file():
+            break
+        if (level / ".git").exists():
+            return None
+    else:
+        return None
+    fields = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    if not fields or any("$Format" in value for value in fields.values()):
+        return None
+    return fields
+
+
+def tag_from_archival(fields: dict[str, str]) -> str | None:
+    """Return the tag of the exported commit, like ``git describe --exact-match``."""
+    for ref in fields.get("ref-names", "").split(","):
+        if (ref := ref.strip()).startswith("tag: "):
+            return ref[len("tag: ") :]
+    describe = fields.get("describe-name", "")
+    if describe and not _DESCRIBE_DISTANCE.search(describe):
+        return describe
+    return None
+
+
+def _git_lines(cwd: Path, *args: str) -> list[str]:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise ValueError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout.splitlines()
+
+
+def _list_tags(cwd: Path) -> dict[str, str]:
+    lines = _git_lines(
+        cwd,
+        "for-each-ref",
+        "--sort=-creatordate",
+        "--format=%(objectname) %(*objectname) %(refname:strip=2)",
+        "refs/tags",
+    )
+    tags: dict[str, str] = {}
+    for line in lines:
+        obj, peeled, name = line.split(" ", 2)
+        # Annotated tags point to the commit through their peeled object
+        tags.setdefault(peeled or obj, name)
+    return tags
+
+
+@contextmanager
+def _rev_list(cwd: Path, *args: str) -> Iterator[Iterator[str]]:
+    with subprocess.Popen(
+        ["git", "rev-list", "--topo-order", "--reverse", "--children", *args, "--"],
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        yield proc.stdout
+        error = proc.stderr.read()
+    if proc.returncode:
+        raise ValueError(error.strip() or f"Invalid revision: {' '.join(args)}")
+
+
+def _offer(
+    pending: dict[str, tuple[int, str]],
+    children: Iterable[str],
+    nearest: tuple[int, str] | None,
+) -> None:
+    if nearest is None:
+        return
+    offer = (nearest[0] + 1, nearest[1])
+    for child in children:
+        if child not in pending or offer[0] < pending[child][0]:
+            pending[child] = offer
+
+
+def _propagate(
+    lines: Iterable[str],
+    tags: dict[str, str],
+    pending: dict[str, tuple[int, str]],
+) -> Iterator[tuple[str, tuple[int, str] | None]]:
+    """Yield ``(commit, (distance, tag))`` of ``rev-list --children`` lines.
+
+    ``pending`` holds the nearest tag offered to commits whose parents were
+    read, so only the commits on the current frontier are kept in memory.
+    """
+    for line in lines:
+        commit, *children = line.split()
+        nearest = pending.pop(commit, None)
+        if commit in tags:
+            nearest = (0, tags[commit])
+        yield commit, nearest
+        _offer(pending, children, nearest)
+
+
+def iter_version_history(
+    start: Path, revision_range: str = "HEAD"
+) -> Iterator[VersionHistoryEntry]:
+    """Yield the nearest tag of every commit in ``revision_range``, parents first.
+
+    The range is read from a single ``git rev-list --children`` stream and the
+    nearest tag is pushed forward to the children. The excluded parents of the
+    range, which ``--boundary`` lists first, are seeded by walking their own
+    ancestors without yielding them, so a commit gets the same answer whatever
+    the range. The distance is the length of the shortest path to the tag:
+    ``git describe`` reports the same count on linear history, but counts every
+    commit not reachable from the tag after merges.
+    """
+    if (found := find_git_dir(start)) is None:
+        raise FileNotFoundError(f"No Git repository found at {start}")
+    worktree = found[0]
+    tags = _list_tags(worktree)
+    pending: dict[str, tuple[int, str]] = {}
+    with _rev_list(worktree, "--boundary", revision_range) as lines:
+        # With --reverse, the boundary commits come before the range
+        boundary: dict[str, list[str]] = {}
+        first: list[str] = []
+        for line in lines:
+            if not line.startswith("-"):
+                first.append(line)
+                break
+            commit, *children = line[1:].split()
+            boundary[commit] = children
+        if boundary:
+            with _rev_list(worktree, *boundary) as ancestors:
+                for commit, nearest in _propagate(ancestors, tags, {}):
+                    if commit in boundary:
+                        # Only the children in the range are listed with --boundary
+                        _offer(pending, boundary.pop(commit), nearest)
+        for commit, nearest in _propagate(chain(first, lines), tags, pending):
+            yield VersionHistoryEntry(
+                commit,
+                None if nearest is None else nearest[1],
+                None if nearest is None else nearest[0],
+            )
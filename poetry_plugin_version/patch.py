@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -37,6 +38,55 @@ def _patch_poetry_create(factory_mod: ModuleType) -> None:
     factory_mod.Factory.create_poetry = alt_poetry_create
 
 
+def _create_poetry_for_metadata(cwd: Path) -> Poetry:
+    """Create a Poetry instance for writing metadata only.
+
+    Unlike ``Factory.create_poetry``, the configuration is not validated against
+    the JSON schema (the dominant cost of a metadata hook; ``build_wheel`` still
+    validates it) and the package is created with the resolved version directly.
+    """
+    from poetry.core.factory import Factory
+    from poetry.core.poetry import Poetry
+    from poetry.core.pyproject.toml import PyProjectTOML
+
+    # Mirrors poetry.core.factory.Factory.create_poetry (poetry-core 2.5) without
+    # the schema part of Factory.validate, keep it in sync with poetry-core.
+    factory = Factory()
+    poetry_file = factory.locate(cwd)
+    pyproject = PyProjectTOML(path=poetry_file)
+    # Default value that schema validation would have filled in
+    tool_poetry = pyproject.data.setdefault("tool", {}).setdefault("poetry", {})
+    tool_poetry.setdefault("package-mode", True)
+    project = pyproject.data.get("project", {})
+    if tool_poetry["package-mode"] and (
+        missing := [
+            key
+            for key in ("name", "version")
+            if not (project.get(key) or tool_poetry.get(key))
+        ]
+    ):
+        # Same error as the required fields check of Factory.validate
+        raise RuntimeError(
+            "The Poetry configuration is invalid:\n"
+            + "".join(
+                f"  - Either [project.{key}] or [tool.poetry.{key}]"
+                " is required in package mode.\n"
+                for key in missing
+            )
+        )
+    name = project.get("name") or pyproject.poetry_config.get(
+        "name", "non-package-mode"
+    )
+    version = project.get("version") or pyproject.poetry_config.get("version", "0")
+    if (key := _get_and_apply_version(pyproject_path=poetry_file)) and (
+        resolved := _state.projects[key].version
+    ):
+        version = resolved
+    package = factory.get_package(name, version)
+    factory.configure_package(package, pyproject, poetry_file.parent, with_groups=False)
+    return Poetry(poetry_file, pyproject.poetry_config, package)
+
+
 def _apply_patches() -> None:
     if not _state.patched_core_poetry_create:
         from poetry.core import factory as factory_mod
@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import subprocess
 from functools import partial
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from poetry.plugins.application_plugin import ApplicationPlugin
 from poetry.plugins.plugin import Plugin
 
-from .utils import find_version_file, get_version_from_file, parse_package_name
+from .git import (
+    ARCHIVAL_FILE,
+    find_git_dir,
+    read_archival_file,
+    tag_from_archival,
+)
+from .utils import (
+    get_version_filename,
+    get_version_from_file,
+    is_dynamic_version,
+    locate_version_file,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import NoReturn
 
     from cleo.io.io import IO
+    from poetry.console.commands.command import Command
     from poetry.poetry import Poetry
 
 
@@ -33,42 +45,43 @@ class VersionPlugin(Plugin):
         if poetry_version_config is None and not_in_build_system:
             return
         abort = partial(self.abort, io=io)
-        if not (version_source := (poetry_version_config or {}).get("source")) and not (
-            # Accept `path = package_dir/version.py` format to compare with pdm.
-            version_source := (poetry_version_config or {}).get("path")
-        ):
-            if tool_item.get("poetry", {}).get("version") in ("0", "0.0.0"):
-                if not_in_build_system:
-                    abort(
-                        f"<b>{name}</b>: No <b>source</b> configuration found in "
-                        f"[tool.{name}] in pyproject.toml, not extracting dynamic version"
-                    )
-                self.set_version_from_file(poetry, io, name)
+        config = poetry_version_config or {}
+        if not is_dynamic_version(config, tool_item.get("poetry", {})):
+            return
+        if not (config.get("source") or config.get("path")):
+            if not_in_build_system:
+                abort(
+                    f"<b>{name}</b>: No <b>source</b> configuration found in "
+                    f"[tool.{name}] in pyproject.toml, not extracting dynamic version"
+                )
+            self.set_version_from_file(poetry, io, name)
             return
-        if version_source == "git-tag":
+        if (filename := get_version_filename(poetry_version_config)) is None:
             self.set_version_from_git_tag(poetry, io, name)
-        elif version_source.endswith(".py"):
-            self.set_version_from_file(poetry, io, name, filename=version_source)
         else:
-            self.set_version_from_file(poetry, io, name)
+            self.set_version_from_file(poetry, io, name, filename=filename)
 
     def set_version_from_file(
         self, poetry: Poetry, io: IO, name: str, filename: str = "__init__.py"
     ) -> None:
-        init_path = Path(filename)
-        if Path(init_path.name) == init_path or not init_path.is_file():
-            try:
-                package_name = parse_package_name(
-                    poetry.package.name, poetry.local_config, poetry.pyproject.data
-                )
-            except ValueError as e:
-                self.abort(f"<b>{name}</b>: {e}", io=io)
-            try:
-                init_path = find_version_file(package_name, filename, poetry.file.path)
-            except FileNotFoundError as e:
-                self.abort(f"<b>{name}</b>: {e}", io=io)
+        project_dir = poetry.file.path.parent
+        try:
+            init_path = locate_version_file(
+                filename,
+                poetry.package.name,
+                poetry.local_config,
+                poetry.pyproject.data,
+                poetry.file.path,
+            )
+        except (ValueError, FileNotFoundError) as e:
+            self.abort(f"<b>{name}</b>: {e}", io=io)
+        shown_path = (
+            init_path.relative_to(project_dir)
+            if init_path.is_relative_to(project_dir)
+            else init_path
+        )
         io.write_line(
-            f"<b>{name}</b>: Using {filename} file at {init_path} for dynamic version"
+            f"<b>{name}</b>: Using {filename} file at {shown_path} for dynamic version"
         )
         if version := get_version_from_file(init_path):
             io.write_line(
@@ -85,19 +98,47 @@ class VersionPlugin(Plugin):
         )
 
     def set_version_from_git_tag(self, poetry: Poetry, io: IO, name: str) -> None:
-        result = subprocess.run(
-            ["git", "describe", "--exact-match", "--tags", "HEAD"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            text=True,
-        )
-        if result.returncode != 0:
-            self.abort(
-                f"<b>{name}</b>: No Git tag found, not extracting dynamic version",
-                io=io,
+        # Source archives have no .git directory, but may carry the tag in an
+        # export-subst file, which is much cheaper than spawning git.
+        project_dir = poetry.file.path.parent
+        if (
+            find_git_dir(project_dir) is None
+            and (fields := read_archival_file(project_dir)) is not None
+        ):
+            if not (tag := tag_from_archival(fields)):
+                self.abort(
+                    f"<b>{name}</b>: No Git tag found in {ARCHIVAL_FILE}, "
+                    "not extracting dynamic version",
+                    io=io,
+                )
+        else:
+            config = poetry.pyproject.data.get("tool", {}).get(name) or {}
+            # `--dirty` describes the worktree, which implies HEAD
+            revision = "--dirty=+dirty" if config.get("dirty") else "HEAD"
+            result = subprocess.run(
+                ["git", "describe", "--exact-match", "--tags", revision],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
             )
-        tag = result.stdout.strip()
+            if result.returncode != 0:
+                self.abort(
+                    f"<b>{name}</b>: No Git tag found, not extracting dynamic version",
+                    io=io,
+                )
+            tag = result.stdout.strip()
+            if tag.endswith("+dirty") and "+" in tag[: -len("+dirty")]:
+                # The tag already has a local version segment
+                tag = tag[: -len("+dirty")] + ".dirty"
         io.write_line(
             f"<b>{name}</b>: Git tag found, setting dynamic version to: {tag}"
         )
         poetry.package._set_version(tag)
+
+
+class VersionApplicationPlugin(ApplicationPlugin):
+    @property
+    def commands(self) -> list[type[Command]]:
+        from .command import BumpVersionCommand, VersionHistoryCommand
+
+        return [BumpVersionCommand, VersionHistoryCommand]
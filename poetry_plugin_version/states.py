@@ -2,7 +2,6 @@ from __future__ import annotations
 
 __all__ = []  # type: ignore
 
-import os
 from collections.abc import MutableMapping
 from enum import Enum
 from pathlib import Path
@@ -64,6 +63,20 @@ def _get_pyproject_path(start: Path | None = None) -> Path | None:
     return _find_higher_file("pyproject.toml", start=start)
 
 
+def _get_metadata_version(metadata_directory: Path) -> str | None:
+    metadata = metadata_directory / "METADATA"
+    if not metadata.is_file():
+        return None
+    with metadata.open(encoding="utf-8") as f:
+        # Only the header needs to be scanned, the description follows it
+        for line in f:
+            if not line.strip():
+                break
+            if line.startswith("Version:"):
+                return line[len("Version:") :].strip()
+    return None
+
+
 def _get_pyproject_path_from_poetry(pyproject: PyProjectTOML) -> Path:
     if not (recommended := getattr(pyproject, "path", None)):
         raise RuntimeError(
@@ -80,11 +93,13 @@ def _get_version(
     file: str = "__init__.py",
 ) -> str | None:
     package_name = parse_package_name(name, poetry_config, pyproject_data)
-    version_path = find_version_file(package_name, file, pyproject_path.parent)
+    version_path = find_version_file(package_name, file, pyproject_path)
     return get_version_from_file(version_path)
 
 
-def _get_and_apply_version(pyproject_path: Path | None = None) -> str | None:
+def _get_and_apply_version(
+    pyproject_path: Path | None = None, known_version: str | None = None
+) -> str | None:
     if pyproject_path is None:
         pyproject_path = _get_pyproject_path()
         if pyproject_path is None:
@@ -117,14 +132,12 @@ def _get_and_apply_version(pyproject_path: Path | None = None) -> str | None:
         return name
 
     original = poetry_config["version"]
-    if (version := original) in ("0", "0.0.0"):
-        initial_dir = Path.cwd()
-        target_dir = pyproject_path.parent
-        os.chdir(str(target_dir))
-        try:
-            version = _get_version(pyproject_path, name, poetry_config, pyproject)
-        finally:
-            os.chdir(str(initial_dir))
+    version: str | None
+    if known_version is not None:
+        # Already resolved by an earlier build step, e.g. in prepared metadata
+        version = known_version
+    elif (version := original) in ("0", "0.0.0"):
+        version = _get_version(pyproject_path, name, poetry_config, pyproject)
     if name is not None:
         if classic and original is not None:
             mode = _Mode.Classic
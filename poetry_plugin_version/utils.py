@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import ast
 import contextlib
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
 from poetry.core.utils.helpers import module_name
 
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+_STRING_LITERAL = re.compile(rb"([rRuU]?)('''|\"\"\"|'|\")")
+
 with contextlib.suppress(ImportError):
     from poetry.console.commands.build import BuildHandler
 
@@ -24,36 +32,90 @@ with contextlib.suppress(ImportError):
     BuildHandler._requires_isolated_build = _requires_isolated_build  # type:ignore
 
 
-def get_version_from_file(init_path: Path) -> str | None:
-    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+def _find_version_node(tree: ast.Module) -> ast.Constant | None:
     for el in tree.body:
         if isinstance(el, ast.Assign) and len(el.targets) == 1:
             target = el.targets[0]
             if isinstance(target, ast.Name) and target.id == "__version__":
                 if isinstance(value_node := el.value, ast.Constant):
-                    version = value_node.value
-                elif isinstance(value_node, ast.Str):
-                    version = value_node.s
+                    return value_node
                 else:  # pragma: nocover
                     # This is actually covered by tests, but can't be
                     # reported by Coverage
                     # Ref: https://github.com/nedbat/coveragepy/issues/198
                     continue
-                return cast(str, version)
     return None
 
 
+def get_version_from_file(init_path: Path) -> str | None:
+    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    if (node := _find_version_node(tree)) is None:
+        return None
+    return cast(str, node.value)
+
+
+def _line_starts(data: bytes, last_lineno: int) -> list[int]:
+    # AST line numbers are 1-based and column offsets are UTF-8 byte offsets,
+    # so only the lines up to the literal need to be measured.
+    starts = [0, 0]
+    for match in _LINE_END.finditer(data):
+        if len(starts) > last_lineno:
+            break
+        starts.append(match.end())
+    return starts
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def replace_version_in_file(
+    init_path: Path, version: str | Callable[[str], str]
+) -> tuple[str, str]:
+    """Rewrite the ``__version__`` literal of ``init_path`` in place.
+
+    ``version`` is the new value, or a function computing it from the old one.
+    Only the bytes of the string literal are replaced, keeping its prefix and
+    quote style; everything else in the file is written back untouched.
+    Returns the old and the new version.
+    """
+    data = init_path.read_bytes()
+    node = _find_version_node(ast.parse(data))
+    if node is None or node.end_lineno is None or node.end_col_offset is None:
+        raise ValueError(
+            f"No valid __version__ variable found in {init_path.name}, "
+            "cannot update dynamic version"
+        )
+    starts = _line_starts(data, node.end_lineno)
+    start = starts[node.lineno] + node.col_offset
+    end = starts[node.end_lineno] + node.end_col_offset
+    if not (m := _STRING_LITERAL.match(data, start, end)):
+        raise ValueError(f"__version__ in {init_path.name} is not a string literal")
+    old = cast(str, node.value)
+    new = version(old) if callable(version) else version
+    prefix, quote = m.groups()
+    literal = prefix + quote + new.encode() + quote
+    _write_atomic(init_path, data[:start] + literal + data[end:])
+    return old, new
+
+
 def find_version_file(package_name: str, filename: str, pyproject_path: Path) -> Path:
-    init_path = Path(package_name) / filename
-    if init_path.is_file():
-        return init_path
-    abs_init_path = pyproject_path.parent / init_path
+    project_dir = pyproject_path.parent
+    abs_init_path = project_dir / package_name / filename
     if abs_init_path.is_file():
         return abs_init_path
-    src_init = Path("src") / init_path
-    if src_init.is_file():
-        return src_init
-    abs_src_init = pyproject_path.parent / "src" / init_path
+    abs_src_init = project_dir / "src" / package_name / filename
     if abs_src_init.is_file():
         return abs_src_init
     raise FileNotFoundError(
@@ -61,6 +123,43 @@ def find_version_file(package_name: str, filename: str, pyproject_path: Path) ->
     )
 
 
+def is_dynamic_version(
+    config: dict[str, Any] | None, poetry_config: dict[str, Any]
+) -> bool:
+    """Return whether the plugin sets the version, not ``tool.poetry.version``."""
+    config = config or {}
+    if config.get("source") or config.get("path"):
+        return True
+    return poetry_config.get("version") in ("0", "0.0.0")
+
+
+def get_version_filename(config: dict[str, Any] | None) -> str | None:
+    """Return the file of ``__version__`` set in the plugin config, None for git-tag."""
+    config = config or {}
+    # Accept `path = package_dir/version.py` format to compare with pdm.
+    source = config.get("source") or config.get("path") or ""
+    if source == "git-tag":
+        return None
+    return source if source.endswith(".py") else "__init__.py"
+
+
+def locate_version_file(
+    filename: str,
+    name: str,
+    poetry_config: dict[str, Any],
+    pyproject_data: dict[str, Any],
+    pyproject_path: Path,
+) -> Path:
+    # A source with dirname is relative to the project, e.g. `pkg/version.py`
+    if (
+        Path(Path(filename).name) != Path(filename)
+        and (init_path := pyproject_path.parent / filename).is_file()
+    ):
+        return init_path
+    package_name = parse_package_name(name, poetry_config, pyproject_data)
+    return find_version_file(package_name, filename, pyproject_path)
+
+
 def parse_package_name(
     name: str, poetry_config: dict[str, Any], pyproject_data: dict[str, Any]
 ) -> str:
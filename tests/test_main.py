@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import functools
+import json
 import os
 import shlex
 import shutil
 import subprocess
+import tarfile
 from pathlib import Path
 
 import pkginfo
@@ -306,3 +308,282 @@ def test_git_tag(tmp_path: Path) -> None:
     result = display_version(testing_dir)
     assert result.returncode == 0
     assert "0.0.9" in result.stdout
+
+
+def test_bump_version(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("version_dot_py", testing_dir)
+    other_dir = tmp_path / "other_package"
+    copy_assets("no_packages", other_dir)
+    init_file = other_dir / "test_custom_version" / "__init__.py"
+    init_file.write_text("# comment\n__version__ = '0.0.1'  # keep\nx = 1\n")
+    result = build_package(testing_dir, command="poetry bump-version minor")
+    assert result.returncode == 0
+    assert "Bumping version from 0.0.8 to 0.1.0" in result.stdout
+    version_file = testing_dir / "test_custom_version" / "version.py"
+    assert version_file.read_text() == '__version__ = "0.1.0"\n'
+    result = display_version(testing_dir)
+    assert "0.1.0" in result.stdout
+    result = build_package(
+        testing_dir, command=f"poetry bump-version patch -s . {other_dir}"
+    )
+    assert result.returncode == 0
+    assert result.stdout.split() == ["0.1.1", "0.0.2"]
+    assert init_file.read_text() == "# comment\n__version__ = '0.0.2'  # keep\nx = 1\n"
+    result = build_package(testing_dir, command="poetry bump-version 1.0.0 --dry-run")
+    assert "Bumping version from 0.1.1 to 1.0.0" in result.stdout
+    assert version_file.read_text() == '__version__ = "0.1.1"\n'
+    # A failing project is reported without stopping the batch
+    missing_dir = tmp_path / "missing"
+    result = run_by_subprocess(
+        f"poetry bump-version patch -s {missing_dir} .", cwd=testing_dir
+    )
+    assert result.returncode != 0
+    assert f"pyproject.toml file not found at {missing_dir}" in result.stderr
+    assert result.stdout.split() == ["0.1.2"]
+    # Static versions are not managed by the plugin
+    static_dir = tmp_path / "static_package"
+    copy_assets("no_config", static_dir)
+    pyproject = static_dir / "pyproject.toml"
+    pyproject.write_text(pyproject.read_text().replace('"0"', '"1.2.3"'))
+    static_init = (static_dir / "test_custom_version" / "__init__.py").read_text()
+    result = build_package(static_dir, command="poetry bump-version patch")
+    assert result.returncode != 0
+    assert "Version is not dynamic" in result.stderr
+    assert (static_dir / "test_custom_version" / "__init__.py").read_text() == (
+        static_init
+    )
+
+
+def test_git_tag_dirty(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("git_tag_dirty", testing_dir)
+    run_shell = functools.partial(run_by_subprocess, cwd=testing_dir)
+    for cmd in (
+        "git init",
+        "git config user.email tester@example.com",
+        "git config user.name Tester",
+        "git add .",
+        "git commit -m release",
+        "git tag 0.0.9",
+    ):
+        assert run_shell(cmd).returncode == 0
+    result = display_version(testing_dir)
+    assert result.returncode == 0
+    assert "0.0.9" in result.stdout
+    assert "+dirty" not in result.stdout
+    readme = testing_dir / "README.md"
+    readme.write_text(readme.read_text() + "changed\n")
+    result = display_version(testing_dir)
+    assert result.returncode == 0
+    assert "0.0.9+dirty" in result.stdout
+    assert run_shell("git checkout README.md").returncode == 0
+    # Stat-only changes, and mode changes with core.fileMode=false, are clean
+    assert run_shell("touch README.md").returncode == 0
+    assert run_shell("git config core.fileMode false").returncode == 0
+    readme.chmod(0o755)
+    result = display_version(testing_dir)
+    assert "0.0.9" in result.stdout
+    assert "+dirty" not in result.stdout
+    assert run_shell("git rm -q --cached README.md").returncode == 0
+    result = display_version(testing_dir)
+    assert "0.0.9+dirty" in result.stdout
+
+
+def extract_archive(archive: Path, dest: Path) -> None:
+    with tarfile.open(archive) as tar:
+        if hasattr(tarfile, "data_filter"):
+            # Explicit filter, the default changes in Python 3.14
+            tar.extractall(dest, filter="data")
+        else:  # pragma: no cover
+            tar.extractall(dest)
+
+
+def test_git_tag_archival(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("git_tag_archival", testing_dir)
+    run_shell = functools.partial(run_by_subprocess, cwd=testing_dir)
+    for cmd in (
+        "git init",
+        "git config user.email tester@example.com",
+        "git config user.name Tester",
+        "git add .",
+        "git commit -m release",
+        "git tag 0.1.0",
+        f"git archive -o {tmp_path / 'tagged.tar'} HEAD",
+        "git commit --allow-empty -m next",
+        f"git archive -o {tmp_path / 'untagged.tar'} HEAD",
+    ):
+        assert run_shell(cmd).returncode == 0
+    # The unexpanded file of a checkout falls back to `git describe`
+    result = display_version(testing_dir)
+    assert "No Git tag found, not extracting dynamic version" in result.stderr
+    extract_archive(tmp_path / "tagged.tar", tmp_path / "tagged")
+    result = build_package(tmp_path / "tagged")
+    assert (
+        "poetry-plugin-version: Git tag found, setting dynamic version to: 0.1.0"
+        in result.stdout
+    )
+    assert "Built test_custom_version-0.1.0-py3-none-any.whl" in result.stdout
+    extract_archive(tmp_path / "untagged.tar", tmp_path / "untagged")
+    result = display_version(tmp_path / "untagged")
+    assert "No Git tag found in .git_archival.txt" in result.stderr
+    assert result.returncode != 0
+
+
+def test_git_tag_archival_outside_repo(tmp_path: Path) -> None:
+    # An expanded archival file of another project above the checkout
+    (tmp_path / ".git_archival.txt").write_text("ref-names: HEAD -> main, tag: 9.9.9\n")
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("git_tag", testing_dir)
+    run_shell = functools.partial(run_by_subprocess, cwd=testing_dir)
+    for cmd in (
+        "git init",
+        "git config user.email tester@example.com",
+        "git config user.name Tester",
+        "git add .",
+        "git commit -m release",
+        "git tag 0.1.0",
+    ):
+        assert run_shell(cmd).returncode == 0
+    result = display_version(testing_dir)
+    assert result.returncode == 0
+    assert "0.1.0" in result.stdout
+    assert "9.9.9" not in result.stdout
+
+
+PREPARE_METADATA_SCRIPT = """
+import sys
+
+from poetry_plugin_version import api
+
+print(api.prepare_metadata_for_build_wheel(sys.argv[1]))
+"""
+
+BUILD_WHEEL_SCRIPT = """
+import sys
+
+from poetry_plugin_version import api
+
+print(api.build_wheel(sys.argv[1], metadata_directory=sys.argv[2]))
+"""
+
+
+def test_prepare_metadata_reused_by_build_wheel(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("poetry_v2_api", testing_dir)
+    prepare_script, build_script = (
+        tmp_path / "prepare_hook.py",
+        tmp_path / "build_hook.py",
+    )
+    prepare_script.write_text(PREPARE_METADATA_SCRIPT)
+    build_script.write_text(BUILD_WHEEL_SCRIPT)
+    metadata_dir, wheel_dir = tmp_path / "metadata", tmp_path / "wheels"
+    # Like pip, run each hook in its own interpreter
+    result = run_by_subprocess(f"python {prepare_script} {metadata_dir}", testing_dir)
+    assert result.returncode == 0, result.stderr
+    dist_info = metadata_dir / result.stdout.strip()
+    assert dist_info.name == "test_custom_version-0.0.8.dist-info"
+    assert "Version: 0.0.8" in (dist_info / "METADATA").read_text()
+    # A changed __version__ must not be resolved again when metadata is reused
+    init_file = testing_dir / "test_custom_version" / "__init__.py"
+    init_file.write_text('__version__ = "9.9.9"\n')
+    result = run_by_subprocess(
+        f"python {build_script} {wheel_dir} {dist_info}", testing_dir
+    )
+    assert result.returncode == 0, result.stderr
+    wheel_name = result.stdout.strip()
+    assert wheel_name == "test_custom_version-0.0.8-py3-none-any.whl"
+    info = pkginfo.get_metadata(str(wheel_dir / wheel_name))
+    assert info and info.version == "0.0.8"
+
+
+def test_prepare_metadata_invalid_project(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("no_config", testing_dir)
+    pyproject = testing_dir / "pyproject.toml"
+    pyproject.write_text(
+        pyproject.read_text().replace('name = "test-custom-version"', "")
+    )
+    prepare_script = tmp_path / "prepare_hook.py"
+    prepare_script.write_text(PREPARE_METADATA_SCRIPT)
+    result = run_by_subprocess(
+        f"python {prepare_script} {tmp_path / 'metadata'}", testing_dir
+    )
+    assert result.returncode != 0
+    assert (
+        "Either [project.name] or [tool.poetry.name] is required in package mode"
+        in result.stderr
+    )
+    assert not (tmp_path / "metadata").exists()
+
+
+def test_version_history(tmp_path: Path) -> None:
+    testing_dir = tmp_path / "testing_package"
+    copy_assets("no_packages", testing_dir)
+    run_shell = functools.partial(run_by_subprocess, cwd=testing_dir)
+    for cmd in (
+        "git init",
+        "git config user.email tester@example.com",
+        "git config user.name Tester",
+        "git add .",
+        "git commit -m first",
+        "git commit --allow-empty -m second",
+        "git tag -a 0.1.0 -m release",
+        "git commit --allow-empty -m third",
+        "git commit --allow-empty -m fourth",
+        "git tag 0.2.0",
+        "git commit --allow-empty -m fifth",
+    ):
+        assert run_shell(cmd).returncode == 0
+    result = build_package(testing_dir, command="poetry version-history")
+    assert result.returncode == 0, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    expected = [
+        (None, None, None),
+        ("0.1.0", "0.1.0", 0),
+        (None, "0.1.0", 1),
+        ("0.2.0", "0.2.0", 0),
+        (None, "0.2.0", 1),
+    ]
+    assert [(r["version"], r["tag"], r["distance"]) for r in records] == expected
+    head = run_shell("git rev-parse HEAD").stdout.strip()
+    assert records[-1]["commit"] == head
+    result = build_package(testing_dir, command="poetry version-history 0.1.0..HEAD~1")
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["tag"], r["distance"]) for r in records] == [("0.1.0", 1), ("0.2.0", 0)]
+    # Merge a side branch whose tag is closer to the merge than the main one
+    for cmd in (
+        "git checkout -b side HEAD~1",
+        "git commit --allow-empty -m side1",
+        "git tag 0.3.0-side",
+        "git commit --allow-empty -m side2",
+        "git checkout -",
+        "git commit --allow-empty -m sixth",
+        "git merge --no-ff --no-edit side",
+    ):
+        assert run_shell(cmd).returncode == 0
+    result = build_package(testing_dir, command="poetry version-history")
+    records = {
+        r["commit"]: (r["tag"], r["distance"])
+        for r in map(json.loads, result.stdout.splitlines())
+    }
+    merge, side2 = (
+        run_shell(f"git rev-parse {rev}").stdout.strip() for rev in ("HEAD", "side")
+    )
+    assert records[merge] == ("0.3.0-side", 2)
+    assert records[side2] == ("0.3.0-side", 1)
+    # A sub-range gives the same answers as the full history
+    result = build_package(testing_dir, command="poetry version-history HEAD~1..HEAD")
+    sub_records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(sub_records) == 3
+    assert sub_records[-1]["commit"] == merge
+    for r in sub_records:
+        assert (r["tag"], r["distance"]) == records[r["commit"]]
+    # Excluding the side branch keeps the main line only
+    result = build_package(testing_dir, command="poetry version-history side..HEAD")
+    sub_records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(sub_records) == 3
+    assert sub_records[-1]["commit"] == merge
+    for r in sub_records:
+        assert (r["tag"], r["distance"]) == records[r["commit"]]